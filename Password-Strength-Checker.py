@@ -1,21 +1,111 @@
+import hashlib
+import os
+import secrets
+import string
+import tempfile
+from functools import lru_cache
+from typing import NamedTuple
+
 from zxcvbn import zxcvbn
 
+
+# Keyed on the plaintext password, so up to maxsize recent candidates stay
+# in memory until PasswordStrength.clear_cache() is called. Only the score
+# and suggestions are kept, not zxcvbn's full match data.
+@lru_cache(maxsize=2048)
+def _zxcvbn_feedback(password):
+    result = zxcvbn(password)
+    return result["score"], tuple(result["feedback"]["suggestions"])
+
+
+class BloomFilter:
+    """Compact approximate set: no false negatives, ~1% false positives."""
+
+    HASH_COUNT = 7
+    BITS_PER_WORD = 10
+
+    def __init__(self, words, count):
+        # Each entry costs one blake2b digest; the k positions are derived
+        # from it by double hashing.
+        self.size = max(8, count * self.BITS_PER_WORD)
+        self.bits = bytearray((self.size + 7) // 8)
+        for word in words:
+            for position in self._positions(word):
+                self.bits[position >> 3] |= 1 << (position & 7)
+
+    def _positions(self, word):
+        digest = hashlib.blake2b(word, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.HASH_COUNT))
+
+    def __contains__(self, word):
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(word))
+
+    def to_bytes(self):
+        return self.size.to_bytes(8, 'little') + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data):
+        bloom = cls.__new__(cls)
+        bloom.size = int.from_bytes(data[:8], 'little')
+        bloom.bits = bytearray(data[8:])
+        if bloom.size <= 0 or len(bloom.bits) != (bloom.size + 7) // 8:
+            raise ValueError("Corrupt Bloom filter data.")
+        return bloom
+
+
 class Wordlist:
+    __slots__ = ('file_path', 'use_bloom', '_words')
     _cache = {}
+    # Bump when the on-disk cache format changes so stale caches are
+    # rebuilt rather than silently matching nothing.
+    _DISK_CACHE_VERSION = 2
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, use_bloom=False):
+        # Loading is deferred to the first lookup, so fail fast on paths
+        # that cannot be read to keep reporting bad input at construction.
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Error: File '{file_path}' not found.")
+        if not os.path.isfile(file_path) or not os.access(file_path, os.R_OK):
+            raise RuntimeError(
+                f"Error loading wordlist from '{file_path}': not a readable file"
+            )
         self.file_path = file_path
-        self.words = self.load_wordlist()
+        self.use_bloom = use_bloom
+        self._words = None
+
+    @property
+    def words(self):
+        if self._words is None:
+            self._words = self.load_wordlist()
+        return self._words
 
     def load_wordlist(self):
-        if self.file_path in self._cache:
-            return self._cache[self.file_path]
+        cache_key = (self.file_path, self.use_bloom)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
 
         try:
-            with open(self.file_path, 'r') as file:
-                wordlist = [line.strip() for line in file]
-                self._cache[self.file_path] = wordlist
-                return wordlist
+            stat = os.stat(self.file_path)
+            key = (self._DISK_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+            wordlist = self._load_disk_cache(key)
+            if wordlist is None:
+                with open(self.file_path, 'rb') as file:
+                    # One bulk read and a single C-level split instead of
+                    # per-line Python iteration over the file object.
+                    data = file.read()
+                lines = data.splitlines()
+                entries = (self._normalize(line) for line in lines)
+                # Feed the filter directly so the exact set is never built.
+                if self.use_bloom:
+                    wordlist = BloomFilter(entries, len(lines))
+                else:
+                    wordlist = frozenset(entries)
+                del lines
+                self._save_disk_cache(key, wordlist)
+            self._cache[cache_key] = wordlist
+            return wordlist
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Error: File '{self.file_path}' not found.") from e
         except Exception as e:
@@ -23,21 +113,105 @@ class Wordlist:
                 f"Error loading wordlist from '{self.file_path}': {str(e)}"
             ) from e
 
+    def _disk_cache_path(self):
+        return self.file_path + ('.bloom.cache' if self.use_bloom else '.cache')
+
+    @staticmethod
+    def _disk_cache_header(key):
+        return ' '.join(map(str, key)).encode('ascii') + b'\n'
+
+    @staticmethod
+    def _is_trusted(stat):
+        # Anyone who can rewrite the cache decides which passwords are
+        # flagged, so only trust files owned by us and not writable by others.
+        if not hasattr(os, 'getuid'):
+            return True
+        return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+    def _load_disk_cache(self, key):
+        try:
+            with open(self._disk_cache_path(), 'rb') as file:
+                if not self._is_trusted(os.fstat(file.fileno())):
+                    return None
+                if file.readline() != self._disk_cache_header(key):
+                    return None
+                data = file.read()
+            if self.use_bloom:
+                return BloomFilter.from_bytes(data)
+            return frozenset(data.split(b'\n'))
+        except (OSError, ValueError):
+            return None
+
+    def _save_disk_cache(self, key, wordlist):
+        # The cache is only an accelerator, so an unwritable directory
+        # must not stop the wordlist from loading.
+        if self.use_bloom:
+            data = wordlist.to_bytes()
+        else:
+            data = b'\n'.join(wordlist)
+        cache_path = self._disk_cache_path()
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or '.')
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(self._disk_cache_header(key))
+                file.write(data)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _normalize(line):
+        # Entries stay as bytes: they hash faster and take less memory than
+        # str. Only non-ASCII UTF-8 lines need str.lower() to match queries;
+        # undecodable lines are kept whole rather than having bytes dropped.
+        line = line.strip()
+        if line.isascii():
+            return line.lower()
+        try:
+            return line.decode('utf-8').lower().encode('utf-8')
+        except UnicodeDecodeError:
+            return line.lower()
+
     def is_word_in_list(self, word):
-        return word in self.words
+        # surrogateescape maps input() text from undecodable bytes back to
+        # exactly those bytes, so it lines up with the entries kept whole.
+        try:
+            query = word.lower().encode('utf-8', 'surrogateescape')
+        except UnicodeEncodeError:
+            return False
+        return query in self.words
+
+
+class StrengthResult(NamedTuple):
+    # Immutable so the shared rejection results below cannot be altered
+    # by one caller for everyone else.
+    strength: str
+    score: int
+    message: str
 
 
-class StrengthResult:
-    def __init__(self, strength: str, score: int, message: str):
-        self.strength = strength
-        self.score = score
-        self.message = message
+_TOO_SHORT = StrengthResult("Too short", 0, "Password should be at least 12 characters long.")
+_COMMON = StrengthResult("Weak", 0, "Password is commonly used and easily guessable.")
+_BANNED = StrengthResult("Weak", 0, "Password appears to be on the banned list.")
 
 
 class PasswordStrength:
-    def __init__(self, weak_wordlist_path: str = None, banned_wordlist_path: str = None):
+    def __init__(self, weak_wordlist_path: str = None, banned_wordlist_path: str = None,
+                 use_bloom_for_banned: bool = False):
         self.weak_wordlist = Wordlist(weak_wordlist_path) if weak_wordlist_path else None
-        self.banned_wordlist = Wordlist(banned_wordlist_path) if banned_wordlist_path else None
+        # Opt-in for very large banned lists: the Bloom filter is much smaller
+        # than the exact set but slower to build and ~1% of unlisted
+        # passwords will match it.
+        self.banned_wordlist = (
+            Wordlist(banned_wordlist_path, use_bloom=use_bloom_for_banned)
+            if banned_wordlist_path else None
+        )
         self.MIN_PASSWORD_LENGTH = 12
 
     def check_password_strength(self, password: str) -> StrengthResult:
@@ -50,21 +224,68 @@ class PasswordStrength:
         Returns:
             A StrengthResult object containing the password strength, score, and a message.
         """
+        return self._quick_check(password) or self._score_password(password)
+
+    def check_many(self, passwords: list[str]) -> list[StrengthResult]:
+        """
+        Check the strength of several passwords at once.
+
+        The cheap length and wordlist checks run over the whole batch first,
+        so zxcvbn is only invoked for the passwords that survive them.
+
+        Args:
+            passwords: The passwords to check.
+
+        Returns:
+            A list of StrengthResult objects in the same order as the input.
+        """
+        results = [self._quick_check(password) for password in passwords]
+        return [
+            result or self._score_password(password)
+            for password, result in zip(passwords, results)
+        ]
+
+    def _quick_check(self, password: str):
         if len(password) < self.MIN_PASSWORD_LENGTH:
-            return StrengthResult("Too short", 0, "Password should be at least 12 characters long.")
+            return _TOO_SHORT
 
         if self.weak_wordlist and self.weak_wordlist.is_word_in_list(password):
-            return StrengthResult("Weak", 0, "Password is commonly used and easily guessable.")
+            return _COMMON
 
-        password_strength = zxcvbn(password)
-        score = password_strength["score"]
+        if self.banned_wordlist and self.banned_wordlist.is_word_in_list(password):
+            return _BANNED
+
+        return None
+
+    @staticmethod
+    def _score_password(password: str) -> StrengthResult:
+        score, suggestions = _zxcvbn_feedback(password)
 
         if score >= 3:
             return StrengthResult("Strong", score, f"Password meets all the requirements. Score: {score}/4")
-        suggestions = password_strength["feedback"]["suggestions"]
         return StrengthResult("Weak", score, f"Password is weak. Suggestions: {', '.join(suggestions)}")
 
+    @staticmethod
+    def clear_cache():
+        """Forget all memoized zxcvbn results, and the passwords they are keyed on."""
+        _zxcvbn_feedback.cache_clear()
+
+    def generate_random_password(self, length: int = 16) -> str:
+        """
+        Generate a random password using a cryptographically secure source.
+
+        Args:
+            length: The number of characters in the password.
+
+        Returns:
+            A random password drawn from letters, digits and punctuation.
+        """
+        characters = string.ascii_letters + string.digits + string.punctuation
+        return ''.join(secrets.SystemRandom().choices(characters, k=length))
+
 if __name__ == '__main__':
+    checkers = {}
+
     while True:
         try:
             num_passwords = int(input("Enter the number of passwords to test (enter 0 to exit): "))
@@ -80,18 +301,28 @@ if __name__ == '__main__':
             weak_wordlist_path = input("Enter the path to the weak wordlist file (leave blank for default): ")
             banned_wordlist_path = input("Enter the path to the banned wordlist file (leave blank for default): ")
 
-            password_strength_checker = PasswordStrength(weak_wordlist_path, banned_wordlist_path)
+            key = (weak_wordlist_path, banned_wordlist_path)
+            if key not in checkers:
+                checkers[key] = PasswordStrength(weak_wordlist_path, banned_wordlist_path)
+            password_strength_checker = checkers[key]
         except Exception as e:
             print(f"Error initializing PasswordStrength: {str(e)}")
             continue
 
         for _ in range(num_passwords):
             password = input("Enter a password: ")
-            result = password_strength_checker.check_password_strength(password)
+            try:
+                result = password_strength_checker.check_password_strength(password)
+            except RuntimeError as e:
+                print(str(e))
+                break
             print(f"{result.strength}: {result.message}")
 
             if result.strength == "Weak":
                 print("Suggested strong password:", password_strength_checker.generate_random_password())
 
+        # Don't keep this batch's passwords in memory for the rest of the session.
+        PasswordStrength.clear_cache()
+
     print("Thank you for using the Password Strength Checker.")
 